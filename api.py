@@ -1,11 +1,291 @@
 from __future__ import annotations
 import os
+import json
+import struct
 import datetime
-from typing import List, Optional, Iterator, Dict, Any
+import tempfile
+import threading
+import time
+import zlib
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import List, Optional, Iterable, Iterator, Dict, Any, Sequence, Tuple, get_args
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import psycopg2
+import psycopg2.errors
+import psycopg2.extras
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+import pyarrow as pa
 from pydantic import BaseModel, ConfigDict
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+
+# Rows pulled from the server per round trip when streaming submissions.
+# Large enough to amortise per-FETCH overhead, small enough to keep a
+# batch of Submission objects comfortably in memory.
+DEFAULT_BATCH_SIZE = 8192
+
+# Lower bound for a server-side cursor's ``itersize``: small consumer batch
+# sizes should not translate into one network round trip per handful of rows.
+MIN_ITERSIZE = 1000
+
+
+# ---------------------------------------------------------------------------
+# Connection pooling
+# ---------------------------------------------------------------------------
+
+# One pool per (database_url, schema), shared by every CompetitionDataset
+# pointing at the same database so that new instances skip the TLS handshake
+# and concurrent readers do not serialise on a single connection.
+_POOLS: Dict[Tuple[str, str], "_BlockingConnectionPool"] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+class _PooledConnection(psycopg2.extensions.connection):
+    """Connection that remembers which statements have been PREPAREd on it."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: set = set()
+        # runs.meta / runs.system_info are JSONB; decode them with orjson when
+        # it is available, which is several times faster than the stdlib json
+        # module.  Registered per connection so other psycopg2 users in the
+        # process are unaffected.
+        if orjson is not None:
+            psycopg2.extras.register_default_jsonb(conn_or_curs=self, loads=orjson.loads)
+
+
+class _BlockingConnectionPool(ThreadedConnectionPool):
+    """
+    ThreadedConnectionPool whose ``getconn`` waits for a free connection
+    instead of raising ``PoolError`` as soon as ``maxconn`` are checked out.
+    """
+
+    def __init__(self, minconn: int, maxconn: int, *args, **kwargs):
+        super().__init__(minconn, maxconn, *args, **kwargs)
+        self._slots = threading.BoundedSemaphore(maxconn)
+
+    def getconn(self, key=None, timeout: Optional[float] = None):
+        if not self._slots.acquire(timeout=timeout):
+            raise PoolError(
+                f"no pooled connection became free within {timeout}s; all {self.maxconn} "
+                f"are in use (each unfinished iterator holds one) -- raise max_connections"
+            )
+        try:
+            return super().getconn(key)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn=None, key=None, close=False):
+        try:
+            super().putconn(conn, key, close)
+        finally:
+            self._slots.release()
+
+    def _putconn(self, conn, key=None, close=False):
+        # psycopg2 only keeps ``minconn`` idle connections and closes the
+        # rest, which would reconnect (and re-PREPARE) on most calls.  Keep up
+        # to ``maxconn`` open instead; otherwise this mirrors the base class.
+        if self.closed:
+            raise PoolError("connection pool is closed")
+        if key is None:
+            key = self._rused.get(id(conn))
+            if key is None:
+                raise PoolError("trying to put unkeyed connection")
+
+        if not close and not conn.closed and len(self._pool) < self.maxconn:
+            status = conn.info.transaction_status
+            if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+                conn.close()
+            else:
+                if status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+                self._pool.append(conn)
+        elif not conn.closed:
+            conn.close()
+
+        del self._used[key]
+        del self._rused[id(conn)]
+
+
+def _get_pool(database_url: str, schema: str, max_connections: int) -> _BlockingConnectionPool:
+    """Return the shared pool for *database_url*/*schema*, creating it if needed."""
+    key = (database_url, schema)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None or pool.closed:
+            pool = _BlockingConnectionPool(
+                1, max_connections, database_url, sslmode="require",
+                connection_factory=_PooledConnection,
+            )
+            _POOLS[key] = pool
+        return pool
+
+
+def close_all_pools() -> None:
+    """Close every pooled connection opened by this module."""
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            if not pool.closed:
+                pool.closeall()
+        _POOLS.clear()
+
+
+# ---------------------------------------------------------------------------
+# Binary COPY decoding
+# ---------------------------------------------------------------------------
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
+_COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+_PG_EPOCH = datetime.datetime(2000, 1, 1)
+_PG_EPOCH_UTC = _PG_EPOCH.replace(tzinfo=datetime.timezone.utc)
+_PG_EPOCH_DATE = _PG_EPOCH.date()
+
+_INT2 = struct.Struct("!h")
+_INT4 = struct.Struct("!i")
+_INT8 = struct.Struct("!q")
+_FLOAT4 = struct.Struct("!f")
+_FLOAT8 = struct.Struct("!d")
+_NUMERIC_HEADER = struct.Struct("!hhHh")
+
+# Sentinels PostgreSQL uses for 'infinity' / '-infinity' dates and timestamps.
+_INT4_MIN, _INT4_MAX = -(2 ** 31), 2 ** 31 - 1
+_INT8_MIN, _INT8_MAX = -(2 ** 63), 2 ** 63 - 1
+
+_NUMERIC_NEG = 0x4000
+_NUMERIC_SPECIAL = {0xC000: Decimal("NaN"), 0xD000: Decimal("Infinity"), 0xF000: Decimal("-Infinity")}
+
+
+def _decode_text(buf: bytes) -> str:
+    return buf.decode("utf-8")
+
+
+def _decode_numeric(buf: bytes) -> Decimal:
+    """Decode a binary NUMERIC (base-10000 digits) exactly into a ``Decimal``."""
+    ndigits, weight, sign, dscale = _NUMERIC_HEADER.unpack_from(buf)
+    if sign in _NUMERIC_SPECIAL:
+        return _NUMERIC_SPECIAL[sign]
+    digits = "".join(f"{d:04d}" for d in struct.unpack_from(f"!{ndigits}H", buf, 8))
+    exponent = (weight - ndigits + 1) * 4
+    # Trim or pad the base-10000 groups to exactly dscale fractional digits.
+    if exponent < -dscale:
+        digits = digits[: len(digits) - (-dscale - exponent)]
+    else:
+        digits += "0" * (exponent + dscale)
+    return Decimal((1 if sign == _NUMERIC_NEG else 0, tuple(map(int, digits or "0")), -dscale))
+
+
+def _decode_date(buf: bytes) -> datetime.date:
+    days = _INT4.unpack(buf)[0]
+    if days == _INT4_MAX:
+        return datetime.date.max
+    if days == _INT4_MIN:
+        return datetime.date.min
+    return _PG_EPOCH_DATE + datetime.timedelta(days=days)
+
+
+def _decode_timestamp(buf: bytes) -> datetime.datetime:
+    micros = _INT8.unpack(buf)[0]
+    if micros == _INT8_MAX:
+        return datetime.datetime.max
+    if micros == _INT8_MIN:
+        return datetime.datetime.min
+    return _PG_EPOCH + datetime.timedelta(microseconds=micros)
+
+
+def _timestamptz_decoder(tz: datetime.tzinfo):
+    """
+    Return a decoder for binary ``timestamptz`` values converted to *tz*, the
+    session time zone, matching what the regular cursor path returns.
+    """
+    def decode(buf: bytes) -> datetime.datetime:
+        micros = _INT8.unpack(buf)[0]
+        if micros == _INT8_MAX:
+            return datetime.datetime.max.replace(tzinfo=tz)
+        if micros == _INT8_MIN:
+            return datetime.datetime.min.replace(tzinfo=tz)
+        return (_PG_EPOCH_UTC + datetime.timedelta(microseconds=micros)).astimezone(tz)
+    return decode
+
+
+# Decoders for the binary wire format, keyed by PostgreSQL type OID.
+# timestamptz (1184) depends on the session time zone; see _binary_decoder.
+_BINARY_DECODERS = {
+    16: lambda b: b != b"\x00",                                  # bool
+    20: lambda b: _INT8.unpack(b)[0],                            # int8
+    21: lambda b: _INT2.unpack(b)[0],                            # int2
+    23: lambda b: _INT4.unpack(b)[0],                            # int4
+    700: lambda b: _FLOAT4.unpack(b)[0],                         # float4
+    701: lambda b: _FLOAT8.unpack(b)[0],                         # float8
+    1700: _decode_numeric,                                       # numeric
+    19: _decode_text,                                            # name
+    25: _decode_text,                                            # text
+    1042: _decode_text,                                          # bpchar
+    1043: _decode_text,                                          # varchar
+    114: _json_loads,                                            # json
+    3802: lambda b: _json_loads(b[1:]),                          # jsonb (version byte + text)
+    1082: _decode_date,                                          # date
+    1114: _decode_timestamp,                                     # timestamp
+}
+
+
+def _binary_decoder(column: str, type_oid: int, tz: datetime.tzinfo = datetime.timezone.utc):
+    """
+    Return the binary decoder for a result column, or raise ``ValueError``.
+
+    ``timestamptz`` values are converted to *tz*.
+    """
+    if type_oid == 1184:
+        return _timestamptz_decoder(tz)
+    try:
+        return _BINARY_DECODERS[type_oid]
+    except KeyError:
+        raise ValueError(
+            f"column {column!r} has type OID {type_oid}, which binary COPY decoding does not support"
+        ) from None
+
+
+def _iter_copy_binary(fp, decoders: List[Any]) -> Iterator[tuple]:
+    """
+    Yield one tuple per row from a ``COPY ... (FORMAT BINARY)`` stream.
+
+    *decoders* holds one callable per column, in column order.
+    """
+    header = fp.read(len(_COPY_SIGNATURE) + 8)
+    if header[:len(_COPY_SIGNATURE)] != _COPY_SIGNATURE:
+        raise ValueError("not a PostgreSQL binary COPY stream")
+    extension_len = _INT4.unpack_from(header, len(_COPY_SIGNATURE) + 4)[0]
+    fp.read(extension_len)
+
+    read = fp.read
+    unpack_int2 = _INT2.unpack
+    unpack_int4 = _INT4.unpack
+    while True:
+        (field_count,) = unpack_int2(read(2))
+        if field_count == -1:
+            return
+        row = []
+        for decode in decoders:
+            (size,) = unpack_int4(read(4))
+            row.append(None if size == -1 else decode(read(size)))
+        yield tuple(row)
+
 
 # ---------------------------------------------------------------------------
 # Pydantic models
@@ -13,7 +293,7 @@ from pydantic import BaseModel, ConfigDict
 
 class RunMeta(BaseModel):
     """Metadata about the execution of a submission."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     command: Optional[str] = None
     duration: Optional[float] = None
@@ -25,7 +305,7 @@ class RunMeta(BaseModel):
 
 class RunSystemInfo(BaseModel):
     """System information where the submission was executed."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     cpu: Optional[str] = None
     gpu: Optional[str] = None
@@ -59,8 +339,10 @@ class Submission(BaseModel):
     leaderboard.submission and leaderboard.runs.  The competition_name and
     competition_deadline fields are additionally resolved from the
     leaderboard.leaderboard table so that callers always have full context.
+
+    Instances are read-only snapshots of the database and are frozen.
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: int
     leaderboard_id: int
@@ -87,6 +369,211 @@ class Submission(BaseModel):
     run_system_info: Optional[RunSystemInfo] = None
 
 
+# ---------------------------------------------------------------------------
+# Row materialisation
+# ---------------------------------------------------------------------------
+
+# (SQL expression, Submission field) in the order the submission query
+# selects them.  Rows are fetched as plain tuples and the generated builder
+# indexes them positionally, so this tuple is the single source of truth for
+# the column order.  Columns whose database type does not already map onto
+# the field's annotation are cast here: unvalidated (``model_construct``)
+# models store values exactly as psycopg2 returns them, e.g. ``Decimal``
+# for NUMERIC.
+_SUBMISSION_COLUMNS = (
+    ("sub.id", "id"),
+    ("sub.leaderboard_id", "leaderboard_id"),
+    ("sub.user_id::text", "user_id"),
+    ("sub.submission_time", "submission_time"),
+    ("sub.file_name", "file_name"),
+    ("sub.code_id", "code_id"),
+    ("sub.status::text", "status"),
+    ("sub.done", "done"),
+    ("r.id", "run_id"),
+    ("r.start_time", "run_start_time"),
+    ("r.end_time", "run_end_time"),
+    ("r.mode::text", "run_mode"),
+    ("r.score::float8", "run_score"),
+    ("r.passed", "run_passed"),
+    ("r.meta", "run_meta"),
+    ("r.system_info", "run_system_info"),
+)
+# Position of ``leaderboard_id`` in full submission rows.
+_LEADERBOARD_ID = [name for _, name in _SUBMISSION_COLUMNS].index("leaderboard_id")
+
+# Submission fields resolved from the in-memory competition lookup rather than
+# the query, mapped to their position in the cached competition tuple.
+_COMPETITION_FIELDS = {
+    "competition_name": 0,
+    "competition_deadline": 1,
+    "competition_description": 2,
+}
+_NO_COMPETITION = (None, None, None)
+
+# Upper bound on the compiled row builders a dataset keeps for column
+# projections; the oldest is evicted first.
+_MAX_PROJECTION_BUILDERS = 32
+
+# Minimum seconds between lookup reloads triggered by unknown competition ids,
+# so rows whose competition really is missing cannot cause a reload per row.
+_COMPETITION_RELOAD_INTERVAL = 1.0
+
+
+class _CompetitionLookup(dict):
+    """
+    ``id -> (name, deadline, description)`` for every competition.
+
+    ``fetch(conn)`` reads the table on a connection the caller already
+    holds; the lookup never borrows one itself, so refreshing it from inside
+    a scan cannot exhaust the pool.  ``refresh(conn, ids)`` loads the table
+    on first use and reloads it when *ids* contains one it does not know,
+    so competitions created after the first load are still resolved.
+    Looking up an unknown id (``lookup[id]``) never queries and returns
+    ``_NO_COMPETITION``.
+    """
+
+    def __init__(self, fetch):
+        super().__init__()
+        self._fetch = fetch
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def refresh(self, conn, comp_ids=()) -> None:
+        if self._loaded_at is not None:
+            if time.monotonic() - self._loaded_at < _COMPETITION_RELOAD_INTERVAL:
+                return
+            if all(comp_id is None or comp_id in self for comp_id in comp_ids):
+                return
+        self.reload(conn)
+
+    def reload(self, conn) -> None:
+        with self._lock:
+            self.update(self._fetch(conn))
+            self._loaded_at = time.monotonic()
+
+    def __missing__(self, comp_id):
+        return _NO_COMPETITION
+
+
+# Submission fields whose raw value is a JSON object to be wrapped in a model.
+_NESTED_SUBMISSION_FIELDS = {
+    "run_meta": "RunMeta",
+    "run_system_info": "RunSystemInfo",
+}
+
+
+def _select_columns(fields: Sequence[str]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Return the ``_SUBMISSION_COLUMNS`` entries needed to populate *fields*.
+
+    Competition fields are not selected themselves but need
+    ``leaderboard_id`` for the lookup.  Raises ``ValueError`` for names that
+    are not Submission fields, or if *fields* is empty.
+    """
+    if not fields:
+        raise ValueError("no submission columns requested")
+    unknown = [f for f in fields if f not in Submission.model_fields]
+    if unknown:
+        raise ValueError(f"unknown submission column(s): {', '.join(unknown)}")
+    wanted = set(fields)
+    if wanted & _COMPETITION_FIELDS.keys():
+        wanted.add("leaderboard_id")
+    return tuple((expr, name) for expr, name in _SUBMISSION_COLUMNS if name in wanted)
+
+
+def _compile_submission_builders(
+    validate: bool, competitions: _CompetitionLookup, fields: Optional[Sequence[str]] = None
+):
+    """
+    Generate the functions turning submission row tuples into Submissions.
+
+    Returns ``(build_one, build_many)``: ``build_one(row)`` builds a single
+    Submission and ``build_many(rows)`` a list of them.  The schema is
+    fixed, so rather than looping over fields the builders are emitted as
+    straight-line source with every field inlined as a positional index
+    into the row (see ``_SUBMISSION_COLUMNS``), and compiled once;
+    ``build_many`` inlines the construction into a single list
+    comprehension, avoiding a Python function call per row.
+    Competition fields are looked up as ``competitions[id]`` in a
+    ``_CompetitionLookup``; callers refresh it for the rows' ids first.
+    With *validate* the models are instantiated normally; otherwise
+    ``model_construct`` skips validation.
+
+    When *fields* is given only those Submission fields are populated, and
+    rows must hold the columns chosen by ``_select_columns(fields)``.
+    """
+    # Deduplicate: a repeated name would emit a repeated keyword argument.
+    fields = list(Submission.model_fields) if fields is None else list(dict.fromkeys(fields))
+    positions = {name: index for index, (_, name) in enumerate(_select_columns(fields))}
+    args = []
+    for name in fields:
+        if name in _COMPETITION_FIELDS:
+            value = f"comp[{_COMPETITION_FIELDS[name]}]"
+        else:
+            value = f"r[{positions[name]}]"
+            if name in _NESTED_SUBMISSION_FIELDS:
+                value = f"{_NESTED_SUBMISSION_FIELDS[name]}(**{value}) if {value} else None"
+        args.append(f"        {name}={value},")
+    construct = "Submission(\n" + "\n".join(args) + "\n    )"
+    if _COMPETITION_FIELDS.keys() & set(fields):
+        lookup = f"competitions[r[{positions['leaderboard_id']}]]"
+        assign_comp = f"    comp = {lookup}\n"
+        for_comp = f"    for comp in ({lookup},)\n"
+    else:
+        assign_comp = for_comp = ""
+    source = (
+        "def _build_submission(r):\n"
+        f"{assign_comp}"
+        f"    return {construct}\n"
+        "\n"
+        "def _build_submissions(rows):\n"
+        f"    return [\n    {construct}\n"
+        "    for r in rows\n"
+        f"{for_comp}"
+        "    ]\n"
+    )
+
+    namespace: Dict[str, Any] = {"competitions": competitions}
+    if validate:
+        namespace.update(Submission=Submission, RunMeta=RunMeta, RunSystemInfo=RunSystemInfo)
+    else:
+        namespace.update(
+            Submission=Submission.model_construct,
+            RunMeta=RunMeta.model_construct,
+            RunSystemInfo=RunSystemInfo.model_construct,
+        )
+    exec(compile(source, "<submission builder>", "exec"), namespace)
+    return namespace["_build_submission"], namespace["_build_submissions"]
+
+
+# Arrow type for each Submission field annotation (``Optional`` unwrapped).
+_ARROW_TYPES = {
+    int: pa.int64(),
+    str: pa.string(),
+    float: pa.float64(),
+    bool: pa.bool_(),
+    datetime.datetime: pa.timestamp("us", tz="UTC"),
+}
+
+
+def _arrow_schema(fields: Sequence[str]) -> pa.Schema:
+    """
+    Return the Arrow schema ``to_arrow`` uses for the Submission *fields*.
+
+    Timestamps become ``timestamp[us, tz=UTC]``; naive values are taken to
+    be UTC.  The JSON fields in ``_NESTED_SUBMISSION_FIELDS`` are strings.
+    """
+    schema = []
+    for name in fields:
+        if name in _NESTED_SUBMISSION_FIELDS:
+            schema.append((name, pa.string()))
+            continue
+        annotation = Submission.model_fields[name].annotation
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        schema.append((name, _ARROW_TYPES[args[0] if args else annotation]))
+    return pa.schema(schema)
+
+
 # ---------------------------------------------------------------------------
 # CompetitionDataset
 # ---------------------------------------------------------------------------
@@ -104,6 +591,11 @@ class CompetitionDataset:
     * ``leaderboard.ranking_snapshot`` – periodic leaderboard snapshots
     * ``leaderboard.user_info``    – registered users
 
+    Full scans return submissions in ``submission.id`` order.  When
+    ``runs(submission_id)`` has a btree index they are streamed through a
+    merge join with hash joins disabled; otherwise the planner's choice is
+    left alone.
+
     Usage::
 
         db = CompetitionDataset(DATABASE_URL)
@@ -117,113 +609,281 @@ class CompetitionDataset:
             print(sub)
 
         db.close()
+
+    Connections come from a pool shared by every dataset with the same
+    *database_url* and *schema*.  Each call borrows one for its duration; an
+    iterator keeps its connection until it is exhausted or closed, so
+    ``for sub in db: db.get_competition_by_id(...)`` uses two at once.  When
+    all ``max_connections`` are busy, callers wait up to ``pool_timeout``
+    seconds for one to be returned.  ``db.close()`` does not disconnect;
+    call :func:`close_all_pools` at shutdown to close the pooled connections.
     """
 
     def __init__(
         self,
         database_url: Optional[str] = None,
         schema: str = "leaderboard",
+        validate: bool = False,
+        max_connections: int = 10,
+        count_ttl: float = 60.0,
+        pool_timeout: Optional[float] = 30.0,
     ):
+        """
+        Parameters
+        ----------
+        database_url:
+            PostgreSQL DSN.  Falls back to ``$KERNELBOT_API_URL``.
+        schema:
+            Schema holding the kernelbot tables.
+        validate:
+            Run full Pydantic validation on every Submission built from the
+            database.  Rows come from a trusted schema, so by default they
+            are built with ``model_construct`` which skips validation.
+        max_connections:
+            Upper bound of the connection pool shared by all datasets using
+            the same *database_url* and *schema*.  Only honoured by the
+            dataset that creates the pool.
+        count_ttl:
+            Seconds for which ``len()`` and ``competition_count()`` reuse a
+            previously computed ``COUNT(*)``.  ``0`` disables the cache.
+        pool_timeout:
+            Seconds to wait for a free pooled connection before raising
+            ``psycopg2.pool.PoolError``.  ``None`` waits indefinitely.
+        """
         self.database_url = database_url or os.getenv("KERNELBOT_API_URL", None)
         assert self.database_url
         self._schema = schema
-        self._conn: Optional[psycopg2.extensions.connection] = None
+        self._competitions_by_id = _CompetitionLookup(self._fetch_competitions)
+        self._build_submission, self._build_submissions = _compile_submission_builders(
+            validate, self._competitions_by_id
+        )
+        self._max_connections = max_connections
+        self._pool: Optional[_BlockingConnectionPool] = None
+        self._pool_timeout = pool_timeout
+        # Whether runs(submission_id) is indexed; checked on the first full scan.
+        self._runs_indexed: Optional[bool] = None
+        self._count_ttl = count_ttl
+        self._cached_counts: Dict[str, Tuple[float, int]] = {}
+        # The submission SQL only depends on the schema, so build it once.
+        self._sub_sql = self._submission_query()
+        self._full_scan_sql = self._full_scan_query()
+        # Binary COPY decoders, resolved from the result's type OIDs on the
+        # first iter_submissions_copy() call.
+        self._copy_decoders: Optional[List[Any]] = None
+        # Row builders for column-projected sample_submissions() calls.
+        self._projection_builders: Dict[tuple, tuple] = {}
 
     # ------------------------------------------------------------------
     # Connection management
     # ------------------------------------------------------------------
 
-    def _get_connection(self) -> psycopg2.extensions.connection:
-        """Return an open database connection, reconnecting if necessary."""
-        if self._conn is None or self._conn.closed:
-            self._conn = psycopg2.connect(self.database_url, sslmode="require")
-        return self._conn
+    @contextmanager
+    def _connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """
+        Borrow a connection from the shared pool for the duration of the block.
+
+        Waits up to ``pool_timeout`` seconds when every connection is in use.
+        The connection is handed back (and any open transaction rolled back)
+        on exit, so rows must be fully materialised into models before the
+        block ends -- cursor rows must not outlive it.
+        """
+        if self._pool is None or self._pool.closed:
+            self._pool = _get_pool(self.database_url, self._schema, self._max_connections)
+        pool = self._pool
+        conn = pool.getconn(timeout=self._pool_timeout)
+        try:
+            yield conn
+        finally:
+            pool.putconn(conn)
 
     def close(self) -> None:
-        """Close the database connection and release resources."""
-        if self._conn and not self._conn.closed:
-            self._conn.close()
-            self._conn = None
+        """
+        Release this dataset's handle on the shared connection pool.
+
+        Connections are returned to the pool after every call, so this does
+        not disconnect anything: the pooled connections stay open until
+        :func:`close_all_pools` is called.
+        """
+        self._pool = None
 
     # ------------------------------------------------------------------
     # Internal SQL helpers
     # ------------------------------------------------------------------
 
-    def _submission_query(self) -> str:
+    @staticmethod
+    def _execute_prepared(cur, kind: str, sql: str, params: tuple) -> None:
+        """
+        Execute *sql* (using ``$1``-style placeholders) as a prepared
+        statement, preparing it on first use.
+
+        Prepared statements live as long as the server session, so each
+        pooled connection parses and plans the query only once.  The
+        statement is named after *kind* and a checksum of *sql*, which
+        includes the schema, so datasets on different schemas sharing a
+        backend never run each other's statements.  The server session can be
+        reset underneath the connection (``DISCARD ALL``, or PgBouncer in
+        transaction mode handing out another backend), so if the statement
+        turns out to be missing it is prepared again once; a statement of
+        the same name left by another session user is replaced.  Must be
+        called at the start of a transaction: recovering rolls it back.
+        """
+        conn = cur.connection
+        name = f"{kind}_{zlib.crc32(sql.encode()):08x}"
+        placeholders = ", ".join(["%s"] * len(params))
+        if name in conn.prepared:
+            try:
+                cur.execute(f"EXECUTE {name} ({placeholders})", params)
+                return
+            except psycopg2.errors.InvalidSqlStatementName:
+                conn.rollback()
+                conn.prepared.clear()
+        try:
+            cur.execute(f"PREPARE {name} AS {sql}")
+        except psycopg2.errors.DuplicatePreparedStatement:
+            # Left on this backend by an earlier session user; its text is
+            # unknown, so replace it rather than trust it.
+            conn.rollback()
+            cur.execute(f"DEALLOCATE {name}")
+            cur.execute(f"PREPARE {name} AS {sql}")
+        conn.prepared.add(name)
+        cur.execute(f"EXECUTE {name} ({placeholders})", params)
+
+    def _load_competitions(
+        self, conn: psycopg2.extensions.connection, comp_ids: Iterable[Optional[int]] = ()
+    ) -> None:
+        """
+        Make sure the ``id -> (name, deadline, description)`` lookup used to
+        enrich submissions with competition details knows *comp_ids*.
+
+        There are few competitions and many submissions, so this is far
+        cheaper than joining the wide leaderboard columns onto every
+        submission row.  Competitions created later are picked up when a
+        submission refers to an id the lookup does not know yet.  The lookup
+        is read on *conn*, the connection the caller already holds.
+        """
+        self._competitions_by_id.refresh(conn, comp_ids)
+
+    def _fetch_competitions(self, conn: psycopg2.extensions.connection) -> Dict[int, tuple]:
+        """Read ``id -> (name, deadline, description)`` for all competitions."""
+        with conn.cursor() as cur:
+            cur.execute(f'SELECT id, name, deadline, description FROM "{self._schema}"."leaderboard"')
+            return {
+                comp_id: (name, deadline, description)
+                for comp_id, name, deadline, description in cur.fetchall()
+            }
+
+    def _count(self, table: str, exact: bool = False) -> int:
+        """
+        Return ``COUNT(*)`` of *table*, reusing a cached value younger than
+        ``count_ttl`` unless *exact* is set.
+
+        ``COUNT(*)`` is a full heap scan in PostgreSQL, so repeated ``len()``
+        calls should not each pay for it.
+        """
+        now = time.monotonic()
+        cached = self._cached_counts.get(table)
+        if not exact and cached is not None and now - cached[0] < self._count_ttl:
+            return cached[1]
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute(f'SELECT COUNT(*) FROM "{self._schema}"."{table}";')
+            count = cur.fetchone()[0]
+        self._cached_counts[table] = (now, count)
+        return count
+
+    @staticmethod
+    def _session_timezone(cur) -> datetime.tzinfo:
+        """
+        Return the session's ``TimeZone`` as a tzinfo, falling back to its
+        current UTC offset when the name is not a known IANA zone.
+        """
+        cur.execute("SELECT current_setting('TimeZone'), EXTRACT(timezone FROM now())::int")
+        name, offset = cur.fetchone()
+        try:
+            return ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            return datetime.timezone(datetime.timedelta(seconds=offset))
+
+    def _full_scan_query(self) -> str:
+        """
+        Submission query for whole-table scans, ordered by ``sub.id``.
+
+        Together with ``_prefer_merge_join`` this lets the planner stream a
+        merge join over the ``submission`` primary key and an index on
+        ``runs(submission_id)`` instead of first hashing all of ``runs``.
         """
-        Base SQL that joins submission → runs → leaderboard to produce
-        fully-enriched Submission rows.
+        return self._submission_query() + " ORDER BY sub.id"
+
+    def _prefer_merge_join(self, conn: psycopg2.extensions.connection) -> None:
+        """
+        Turn hash joins off for the rest of *conn*'s current transaction, but
+        only if ``runs(submission_id)`` has a valid, non-partial btree index.
+
+        Without one the planner would have to sort all of ``runs`` for a
+        merge join, which is worse than the hash join it replaces; hash, GIN
+        or partial indexes cannot provide the ordered scan a merge join
+        needs.  Whether the index exists is checked once per dataset.
+        """
+        with conn.cursor() as cur:
+            if self._runs_indexed is None:
+                cur.execute(
+                    """
+                    SELECT EXISTS (
+                        SELECT 1
+                        FROM pg_index i
+                        JOIN pg_class c ON c.oid = i.indexrelid
+                        JOIN pg_am am ON am.oid = c.relam
+                        JOIN pg_attribute a
+                          ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0]
+                        WHERE i.indrelid = %s::regclass
+                          AND a.attname = 'submission_id'
+                          AND am.amname = 'btree'
+                          AND i.indpred IS NULL
+                          AND i.indisvalid
+                    )
+                    """,
+                    (f'"{self._schema}"."runs"',),
+                )
+                self._runs_indexed = cur.fetchone()[0]
+            if self._runs_indexed:
+                cur.execute("SET LOCAL enable_hashjoin = off")
+
+    def _submission_query(
+        self,
+        columns: Sequence[Tuple[str, str]] = _SUBMISSION_COLUMNS,
+        sample_rows: Optional[str] = None,
+    ) -> str:
+        """
+        Base SQL that joins submission → runs, selecting *columns* (a subset
+        of ``_SUBMISSION_COLUMNS``).  Competition details are attached from
+        the lookup filled by ``_load_competitions``.
+
+        *sample_rows* is a placeholder (e.g. ``$1``) for a row count;
+        when given, submissions are drawn with ``TABLESAMPLE SYSTEM_ROWS``.
         """
         s = self._schema
+        select_list = ",\n                ".join(
+            f"{expr:<14} AS {name}" for expr, name in columns
+        )
+        tablesample = f" TABLESAMPLE SYSTEM_ROWS({sample_rows})" if sample_rows else ""
         return f"""
             SELECT
-                sub.id,
-                sub.leaderboard_id,
-                sub.user_id,
-                sub.submission_time,
-                sub.file_name,
-                sub.code_id,
-                sub.status,
-                sub.done,
-                lb.name        AS competition_name,
-                lb.deadline    AS competition_deadline,
-                lb.description AS competition_description,
-                r.id           AS run_id,
-                r.start_time   AS run_start_time,
-                r.end_time     AS run_end_time,
-                r.mode         AS run_mode,
-                r.score        AS run_score,
-                r.passed       AS run_passed,
-                r.meta         AS run_meta,
-                r.system_info  AS run_system_info
-            FROM "{s}"."submission" sub
-            LEFT JOIN "{s}"."leaderboard" lb ON sub.leaderboard_id = lb.id
+                {select_list}
+            FROM "{s}"."submission" sub{tablesample}
             LEFT JOIN "{s}"."runs"        r  ON sub.id = r.submission_id
         """
 
-    @staticmethod
-    def _build_submission(record: dict) -> Submission:
-        """Convert a raw DB row dict into a Submission model instance."""
-        run_meta = None
-        if record.get("run_meta"):
-            run_meta = RunMeta(**record["run_meta"])
-
-        run_system_info = None
-        if record.get("run_system_info"):
-            run_system_info = RunSystemInfo(**record["run_system_info"])
-
-        return Submission(
-            id=record["id"],
-            leaderboard_id=record["leaderboard_id"],
-            user_id=record["user_id"],
-            submission_time=record["submission_time"],
-            file_name=record["file_name"],
-            code_id=record["code_id"],
-            status=record["status"],
-            done=record.get("done"),
-            competition_name=record.get("competition_name"),
-            competition_deadline=record.get("competition_deadline"),
-            competition_description=record.get("competition_description"),
-            run_id=record.get("run_id"),
-            run_start_time=record.get("run_start_time"),
-            run_end_time=record.get("run_end_time"),
-            run_mode=record.get("run_mode"),
-            run_score=record.get("run_score"),
-            run_passed=record.get("run_passed"),
-            run_meta=run_meta,
-            run_system_info=run_system_info,
-        )
-
     # ------------------------------------------------------------------
     # Competition API  (leaderboard.leaderboard)
     # ------------------------------------------------------------------
 
-    def competition_count(self) -> int:
-        """Return the total number of competitions in the database."""
-        conn = self._get_connection()
-        with conn.cursor() as cur:
-            cur.execute(f'SELECT COUNT(*) FROM "{self._schema}"."leaderboard";')
-            return cur.fetchone()[0]
+    def competition_count(self, exact: bool = False) -> int:
+        """
+        Return the total number of competitions in the database.
+
+        The count may be up to ``count_ttl`` seconds old; pass ``exact=True``
+        to recount.
+        """
+        return self._count("leaderboard", exact=exact)
 
     def get_competitions(self, limit: Optional[int] = None) -> List[Competition]:
         """
@@ -234,7 +894,6 @@ class CompetitionDataset:
         limit:
             Maximum number of competitions to return.  ``None`` returns all.
         """
-        conn = self._get_connection()
         sql = (
             f'SELECT id, name, deadline, creator_id, forum_id, '
             f'secret_seed, description, task '
@@ -245,33 +904,28 @@ class CompetitionDataset:
             sql += " LIMIT %s"
             params = (limit,)
 
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        with self._connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql, params)
-            return [Competition(**dict(row)) for row in cur.fetchall()]
+            return [Competition(**row) for row in cur.fetchall()]
 
     def iter_competitions(self, batch_size: int = 10) -> Iterator[Competition]:
         """
         Lazily iterate over all competitions using a server-side cursor.
         """
-        conn = self._get_connection()
         cursor_name = f"comp_iter_{id(self)}"
-        with conn.cursor(name=cursor_name, cursor_factory=RealDictCursor) as cur:
+        with self._connection() as conn, conn.cursor(name=cursor_name, cursor_factory=RealDictCursor) as cur:
+            cur.itersize = max(batch_size, MIN_ITERSIZE)
             cur.execute(
                 f'SELECT id, name, deadline, creator_id, forum_id, '
                 f'secret_seed, description, task '
                 f'FROM "{self._schema}"."leaderboard" ORDER BY id'
             )
-            while True:
-                rows = cur.fetchmany(size=batch_size)
-                if not rows:
-                    break
-                for row in rows:
-                    yield Competition(**dict(row))
+            for row in cur:
+                yield Competition(**row)
 
     def get_competition_by_name(self, name: str) -> Optional[Competition]:
         """Return the Competition with the given name, or ``None`` if not found."""
-        conn = self._get_connection()
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        with self._connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
                 f'SELECT id, name, deadline, creator_id, forum_id, '
                 f'secret_seed, description, task '
@@ -279,12 +933,11 @@ class CompetitionDataset:
                 (name,),
             )
             row = cur.fetchone()
-            return Competition(**dict(row)) if row else None
+            return Competition(**row) if row else None
 
     def get_competition_by_id(self, competition_id: int) -> Optional[Competition]:
         """Return the Competition with the given id, or ``None`` if not found."""
-        conn = self._get_connection()
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        with self._connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(
                 f'SELECT id, name, deadline, creator_id, forum_id, '
                 f'secret_seed, description, task '
@@ -292,31 +945,101 @@ class CompetitionDataset:
                 (competition_id,),
             )
             row = cur.fetchone()
-            return Competition(**dict(row)) if row else None
+            return Competition(**row) if row else None
 
     # ------------------------------------------------------------------
     # Submission API  (leaderboard.submission + runs join)
     # ------------------------------------------------------------------
 
     def __len__(self) -> int:
-        """Return the total number of submissions in the database."""
-        conn = self._get_connection()
-        with conn.cursor() as cur:
-            cur.execute(f'SELECT COUNT(*) FROM "{self._schema}"."submission";')
-            return cur.fetchone()[0]
+        """
+        Return the total number of submissions in the database.
+
+        The count may be up to ``count_ttl`` seconds old; see ``len_exact``.
+        """
+        return self._count("submission")
 
-    def sample_submissions(self, batch_size: int = 10) -> List[Submission]:
+    def len_exact(self) -> int:
+        """Recount the submissions, bypassing (and refreshing) the cached count."""
+        return self._count("submission", exact=True)
+
+    def sample_submissions(
+        self,
+        batch_size: int = 10,
+        columns: Optional[List[str]] = None,
+        randomize: bool = False,
+    ) -> List[Submission]:
         """
         Return up to *batch_size* submissions, enriched with competition and
         run metadata.
 
         Uses SQL ``LIMIT`` so only the requested rows are transferred.
+
+        Parameters
+        ----------
+        batch_size:
+            Maximum number of submissions to return.
+        columns:
+            Submission fields to populate, e.g. ``["id", "run_score"]``.
+            Only the matching columns are selected, which keeps previews from
+            shipping ``meta``/``system_info`` JSON they never look at.  The
+            other fields are left unset, so these partial models are always
+            built with ``model_construct``: the dataset's ``validate=True``
+            is not applied to them.  ``None`` populates every field; an
+            empty list raises ``ValueError``.
+        randomize:
+            Return a random sample instead of whichever rows the server
+            produces first.  Uses ``TABLESAMPLE SYSTEM_ROWS``, which reads
+            only as many heap pages as needed rather than scanning the table,
+            and requires the ``tsm_system_rows`` extension
+            (``CREATE EXTENSION tsm_system_rows``).  Rows are sampled per
+            block, so neighbouring submissions tend to be drawn together.
+        """
+        if columns is not None:
+            return self._sample_projection(batch_size, list(columns), randomize)
+        if randomize:
+            kind, sql = "sample_submissions_random", self._submission_query(sample_rows="$1")
+        else:
+            kind, sql = "sample_submissions", self._sub_sql
+        with self._connection() as conn, conn.cursor() as cur:
+            self._execute_prepared(cur, kind, sql + " LIMIT $1", (batch_size,))
+            rows = cur.fetchall()
+            self._load_competitions(conn, (r[_LEADERBOARD_ID] for r in rows))
+            return self._build_submissions(rows)
+
+    def _sample_projection(
+        self, batch_size: int, columns: List[str], randomize: bool
+    ) -> List[Submission]:
+        """``sample_submissions`` restricted to the Submission fields in *columns*."""
+        key, builders = self._projection_builders_for(columns)
+        selected = _select_columns(key)
+        sql = self._submission_query(
+            selected, sample_rows="%(n)s" if randomize else None
+        ) + " LIMIT %(n)s"
+        with self._connection() as conn, conn.cursor() as cur:
+            cur.execute(sql, {"n": batch_size})
+            rows = cur.fetchall()
+            if _COMPETITION_FIELDS.keys() & set(key):
+                index = [name for _, name in selected].index("leaderboard_id")
+                self._load_competitions(conn, (r[index] for r in rows))
+            return builders[1](rows)
+
+    def _projection_builders_for(self, columns: Sequence[str]):
         """
-        conn = self._get_connection()
-        sql = self._submission_query() + " LIMIT %s"
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(sql, (batch_size,))
-            return [self._build_submission(dict(r)) for r in cur.fetchall()]
+        Return ``(key, (build_one, build_many))`` for the fields in *columns*,
+        where *key* is the sorted field tuple rows must be selected for.
+
+        Field order and duplicates do not change the model built, so the
+        cache is keyed on the normalised field set.
+        """
+        key = tuple(sorted(set(columns)))
+        builders = self._projection_builders.get(key)
+        if builders is None:
+            if len(self._projection_builders) >= _MAX_PROJECTION_BUILDERS:
+                self._projection_builders.pop(next(iter(self._projection_builders)), None)
+            builders = _compile_submission_builders(False, self._competitions_by_id, key)
+            self._projection_builders[key] = builders
+        return key, builders
 
     def get_submissions_for_competition(
         self, competition_id: int, limit: Optional[int] = None
@@ -325,51 +1048,190 @@ class CompetitionDataset:
         Return all submissions for a given competition, optionally capped at
         *limit* rows.
         """
-        conn = self._get_connection()
-        sql = self._submission_query() + " WHERE sub.leaderboard_id = %s ORDER BY sub.submission_time DESC"
-        params: tuple = (competition_id,)
-        if limit is not None:
-            sql += " LIMIT %s"
-            params = (competition_id, limit)
+        # LIMIT NULL means no limit, so one prepared statement covers both cases.
+        sql = (
+            self._sub_sql
+            + " WHERE sub.leaderboard_id = $1 ORDER BY sub.submission_time DESC LIMIT $2"
+        )
+        with self._connection() as conn, conn.cursor() as cur:
+            self._execute_prepared(cur, "submissions_for_competition", sql, (competition_id, limit))
+            rows = cur.fetchall()
+            self._load_competitions(conn, (competition_id,) if rows else ())
+            return self._build_submissions(rows)
 
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(sql, params)
-            return [self._build_submission(dict(r)) for r in cur.fetchall()]
+    def iter_submissions_for_competition(
+        self, competition_id: int, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[Submission]:
+        """
+        Lazily iterate over the submissions of one competition, newest first.
+
+        The competition filter is applied by the server, so only matching
+        rows are transferred; prefer this over filtering ``iter_submissions``
+        on the client, or over ``get_submissions_for_competition`` when the
+        competition has too many submissions to hold in memory.
+        """
+        cursor_name = f"comp_sub_iter_{id(self)}"
+        with self._connection() as conn, conn.cursor(name=cursor_name) as cur:
+            self._load_competitions(conn, (competition_id,))
+            cur.itersize = max(batch_size, MIN_ITERSIZE)
+            cur.execute(
+                self._sub_sql
+                + " WHERE sub.leaderboard_id = %s ORDER BY sub.submission_time DESC",
+                (competition_id,),
+            )
+            for row in cur:
+                yield self._build_submission(row)
 
     def __iter__(self) -> Iterator[Submission]:
         """
         Lazily iterate over all submissions using a server-side cursor.
-        Memory-efficient: rows are streamed in small batches from the server.
+        Memory-efficient: rows are streamed from the server in batches of
+        ``DEFAULT_BATCH_SIZE`` and yielded one at a time.
+        """
+        return self.iter_submissions()
+
+    def iter_submissions(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Submission]:
+        """
+        Iterate over all submissions, pulling *batch_size* rows (at least
+        ``MIN_ITERSIZE``) from the server per round trip.
         """
-        conn = self._get_connection()
         cursor_name = f"sub_iter_{id(self)}"
-        with conn.cursor(name=cursor_name, cursor_factory=RealDictCursor) as cur:
-            cur.execute(self._submission_query())
-            while True:
-                rows = cur.fetchmany(size=10)
-                if not rows:
-                    break
-                for row in rows:
-                    yield self._build_submission(dict(row))
+        lookup = self._competitions_by_id
+        with self._connection() as conn, conn.cursor(name=cursor_name) as cur:
+            self._load_competitions(conn)
+            self._prefer_merge_join(conn)
+            cur.itersize = max(batch_size, MIN_ITERSIZE)
+            cur.execute(self._full_scan_sql)
+            for row in cur:
+                if row[_LEADERBOARD_ID] not in lookup:
+                    self._load_competitions(conn, (row[_LEADERBOARD_ID],))
+                yield self._build_submission(row)
 
-    def iter_submissions(self, batch_size: int = 10) -> Iterator[Submission]:
-        """Alias for ``__iter__`` that makes intent explicit."""
-        return iter(self)
+    def iter_submissions_copy(self) -> Iterator[Submission]:
+        """
+        Iterate over all submissions using ``COPY ... TO STDOUT (FORMAT BINARY)``.
 
-    def iter_batches(self, batch_size: int = 10) -> Iterator[List[Submission]]:
+        Intended for full scans: the binary protocol moves fewer bytes and
+        skips text parsing on both ends.  This is not a streaming scan: the
+        entire result set is first written to a temporary file, which costs
+        disk space proportional to the table and delays the first row until
+        the whole transfer has finished.  In exchange the pooled connection
+        is released as soon as the transfer completes.  Use
+        ``iter_submissions`` when first-row latency or disk usage matter.
+        Raises ``ValueError`` if a column has a type the decoder does not
+        understand.
+        """
+        sql = self._full_scan_sql
+        with tempfile.TemporaryFile() as buf:
+            with self._connection() as conn, conn.cursor() as cur:
+                self._prefer_merge_join(conn)
+                if self._copy_decoders is None:
+                    tz = self._session_timezone(cur)
+                    cur.execute(sql + " LIMIT 0")
+                    self._copy_decoders = [
+                        _binary_decoder(d.name, d.type_code, tz) for d in cur.description
+                    ]
+                decoders = self._copy_decoders
+                cur.copy_expert(f"COPY ({sql}) TO STDOUT (FORMAT BINARY)", buf)
+                # Rows are decoded after the connection is released, so read
+                # the lookup now; it sees every competition the COPY saw.
+                self._competitions_by_id.reload(conn)
+            buf.seek(0)
+            for values in _iter_copy_binary(buf, decoders):
+                yield self._build_submission(values)
+
+    def iter_batches(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[List[Submission]]:
         """
         Iterate over submissions in batches of *batch_size*.
         Each yielded value is a list of Submission objects.
+
+        The next batch is fetched on a background thread while the current
+        one is turned into Submissions (and handed to the caller), so network
+        transfer overlaps with model construction instead of alternating.
         """
-        conn = self._get_connection()
         cursor_name = f"batch_iter_{id(self)}"
-        with conn.cursor(name=cursor_name, cursor_factory=RealDictCursor) as cur:
-            cur.execute(self._submission_query())
+        with self._connection() as conn, conn.cursor(name=cursor_name) as cur, \
+                ThreadPoolExecutor(max_workers=1) as fetcher:
+            self._prefer_merge_join(conn)
+            cur.itersize = max(batch_size, MIN_ITERSIZE)
+            cur.execute(self._full_scan_sql)
+
+            def fetch() -> list:
+                return list(islice(cur, batch_size))
+
+            pending = fetcher.submit(fetch)
+            while True:
+                rows = pending.result()
+                if not rows:
+                    break
+                # Refresh before the next fetch so the connection is idle.
+                self._load_competitions(conn, (r[_LEADERBOARD_ID] for r in rows))
+                pending = fetcher.submit(fetch)
+                yield self._build_submissions(rows)
+
+    # ------------------------------------------------------------------
+    # Columnar API  (pyarrow)
+    # ------------------------------------------------------------------
+
+    def to_arrow(
+        self, columns: Optional[List[str]] = None, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> pa.Table:
+        """
+        Return submission fields as a ``pyarrow.Table`` with one column per
+        requested Submission field (all fields when *columns* is ``None``).
+
+        This is the preferred path when the caller only needs a few fields:
+        only the requested columns are selected and no Submission is built
+        per row.  Each batch of *batch_size* rows is converted to an Arrow
+        record batch as soon as it is fetched, so at most one batch is held
+        as Python objects.  Column types come from the Submission
+        annotations (see ``_arrow_schema``), so they are the same whether or
+        not the result is empty.
+
+        ``run_meta`` and ``run_system_info`` hold free-form JSON whose value
+        types can differ between rows, so they are returned as JSON-encoded
+        strings rather than as inferred struct columns.
+        """
+        columns = list(Submission.model_fields) if columns is None else list(dict.fromkeys(columns))
+        selected = _select_columns(columns)
+        schema = _arrow_schema(columns)
+        # Competition fields come from the cached lookup keyed by leaderboard_id.
+        wants_competition = bool(_COMPETITION_FIELDS.keys() & set(columns))
+        lookup = self._competitions_by_id
+
+        batches = []
+        cursor_name = f"arrow_iter_{id(self)}"
+        with self._connection() as conn, conn.cursor(name=cursor_name) as cur:
+            self._prefer_merge_join(conn)
+            cur.execute(self._submission_query(selected) + " ORDER BY sub.id")
             while True:
-                rows = cur.fetchmany(size=batch_size)
+                rows = cur.fetchmany(batch_size)
                 if not rows:
                     break
-                yield [self._build_submission(dict(r)) for r in rows]
+                values = {name: column for (_, name), column in zip(selected, zip(*rows))}
+                if wants_competition:
+                    self._load_competitions(conn, values["leaderboard_id"])
+                arrays = []
+                for field in schema:
+                    name = field.name
+                    if name in _COMPETITION_FIELDS:
+                        index = _COMPETITION_FIELDS[name]
+                        column = [lookup[lid][index] for lid in values["leaderboard_id"]]
+                    elif name in _NESTED_SUBMISSION_FIELDS:
+                        column = [None if v is None else _json_dumps(v) for v in values[name]]
+                    else:
+                        column = values[name]
+                    arrays.append(pa.array(column, type=field.type))
+                batches.append(pa.record_batch(arrays, schema=schema))
+        return pa.Table.from_batches(batches, schema=schema)
+
+    def get_column(self, name: str, batch_size: int = DEFAULT_BATCH_SIZE) -> pa.ChunkedArray:
+        """Return a single Submission field for every submission, e.g. ``run_score``."""
+        return self.to_arrow([name], batch_size=batch_size).column(name)
+
+    def to_pandas(self, columns: Optional[List[str]] = None):
+        """Return ``to_arrow(columns)`` as a pandas DataFrame (requires pandas)."""
+        return self.to_arrow(columns).to_pandas()
 
     # ------------------------------------------------------------------
     # User API  (leaderboard.user_info)
@@ -384,14 +1246,13 @@ class CompetitionDataset:
         limit:
             Maximum number of users to return.  ``None`` returns all.
         """
-        conn = self._get_connection()
         sql = f'SELECT id, user_name, cli_valid, created_at FROM "{self._schema}"."user_info" ORDER BY created_at'
         params: tuple = ()
         if limit is not None:
             sql += " LIMIT %s"
             params = (limit,)
 
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        with self._connection() as conn, conn.cursor(cursor_factory=RealDictCursor) as cur:
             cur.execute(sql, params)
             return [dict(r) for r in cur.fetchall()]
 
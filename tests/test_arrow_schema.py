@@ -0,0 +1,23 @@
+import pyarrow as pa
+
+from api import Submission, _arrow_schema
+
+
+def test_schema_follows_submission_annotations():
+    schema = _arrow_schema(["id", "done", "run_score", "submission_time", "competition_name"])
+    assert schema.types == [
+        pa.int64(),
+        pa.bool_(),
+        pa.float64(),
+        pa.timestamp("us", tz="UTC"),
+        pa.string(),
+    ]
+
+
+def test_json_fields_are_strings_and_empty_tables_keep_types():
+    schema = _arrow_schema(list(Submission.model_fields))
+    assert schema.field("run_meta").type == pa.string()
+    assert schema.field("run_system_info").type == pa.string()
+    table = pa.Table.from_batches([], schema=schema)
+    assert table.num_rows == 0
+    assert pa.null() not in table.schema.types
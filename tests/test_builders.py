@@ -0,0 +1,97 @@
+import datetime
+
+import pytest
+
+import api
+from api import (
+    _NO_COMPETITION,
+    CompetitionDataset,
+    RunMeta,
+    Submission,
+    _CompetitionLookup,
+    _compile_submission_builders,
+    _select_columns,
+)
+
+NOW = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+COMPETITION = ("matmul", NOW, "multiply matrices")
+
+
+def _lookup():
+    lookup = _CompetitionLookup(lambda conn: {7: COMPETITION})
+    lookup.refresh(None)
+    return lookup
+
+
+def _row(**overrides):
+    values = {
+        "id": 1,
+        "leaderboard_id": 7,
+        "user_id": "u1",
+        "submission_time": NOW,
+        "file_name": "sub.py",
+        "code_id": 3,
+        "status": "done",
+        "done": True,
+        "run_id": 11,
+        "run_start_time": NOW,
+        "run_end_time": NOW,
+        "run_mode": "leaderboard",
+        "run_score": 1.5,
+        "run_passed": True,
+        "run_meta": {"command": "python sub.py", "exit_code": 0},
+        "run_system_info": None,
+    }
+    values.update(overrides)
+    return tuple(values[name] for _, name in api._SUBMISSION_COLUMNS)
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_full_builders(validate):
+    one, many = _compile_submission_builders(validate, _lookup())
+    sub = one(_row())
+    assert isinstance(sub, Submission)
+    assert sub.id == 1 and sub.run_score == 1.5
+    assert sub.competition_name == "matmul"
+    assert sub.competition_description == "multiply matrices"
+    assert isinstance(sub.run_meta, RunMeta) and sub.run_meta.exit_code == 0
+    assert sub.run_system_info is None
+    assert many([_row(), _row(id=2)]) == [sub, one(_row(id=2))]
+
+
+def test_unknown_competition_is_left_empty():
+    one, _ = _compile_submission_builders(False, _lookup())
+    sub = one(_row(leaderboard_id=99))
+    assert (sub.competition_name, sub.competition_deadline, sub.competition_description) == _NO_COMPETITION
+
+
+def test_projection_builders_and_duplicates():
+    fields = ["run_score", "competition_name", "run_score"]
+    selected = [name for _, name in _select_columns(fields)]
+    assert selected == ["leaderboard_id", "run_score"]
+    _, many = _compile_submission_builders(False, _lookup(), fields)
+    (sub,) = many([(7, 2.0)])
+    assert sub.run_score == 2.0 and sub.competition_name == "matmul"
+    assert sub.model_fields_set == {"run_score", "competition_name"}
+
+
+def test_select_columns_rejects_unknown_and_empty():
+    with pytest.raises(ValueError, match="nope"):
+        _select_columns(["id", "nope"])
+    with pytest.raises(ValueError):
+        _select_columns([])
+
+
+def test_projection_cache_is_normalised_and_bounded(monkeypatch):
+    monkeypatch.setattr(api, "_MAX_PROJECTION_BUILDERS", 2)
+    db = CompetitionDataset("postgresql://unused")
+    key, builders = db._projection_builders_for(["run_score", "id", "id"])
+    assert key == ("id", "run_score")
+    assert db._projection_builders_for(["id", "run_score"])[1] is builders
+
+    db._projection_builders_for(["id"])
+    db._projection_builders_for(["status"])
+    assert list(db._projection_builders) == [("id",), ("status",)]
+
+    with pytest.raises(ValueError):
+        db._projection_builders_for([])
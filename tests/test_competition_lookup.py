@@ -0,0 +1,54 @@
+import api
+from api import _NO_COMPETITION, _CompetitionLookup
+
+
+class _FakeFetch:
+    def __init__(self, *tables):
+        self.tables = list(tables)
+        self.conns = []
+
+    def __call__(self, conn):
+        self.conns.append(conn)
+        return self.tables.pop(0) if len(self.tables) > 1 else self.tables[0]
+
+
+def test_first_refresh_loads_on_given_connection():
+    fetch = _FakeFetch({1: ("a", None, None)})
+    lookup = _CompetitionLookup(fetch)
+    lookup.refresh("conn")
+    assert lookup[1] == ("a", None, None)
+    assert fetch.conns == ["conn"]
+
+
+def test_unknown_id_reloads(monkeypatch):
+    monkeypatch.setattr(api, "_COMPETITION_RELOAD_INTERVAL", 0)
+    fetch = _FakeFetch({1: ("a", None, None)}, {1: ("a", None, None), 2: ("b", None, None)})
+    lookup = _CompetitionLookup(fetch)
+    lookup.refresh("conn", [1])
+    lookup.refresh("conn", [1])
+    assert len(fetch.conns) == 1
+    lookup.refresh("conn", [1, 2])
+    assert lookup[2] == ("b", None, None)
+    assert len(fetch.conns) == 2
+
+
+def test_reloads_are_throttled(monkeypatch):
+    monkeypatch.setattr(api, "_COMPETITION_RELOAD_INTERVAL", 3600)
+    fetch = _FakeFetch({1: ("a", None, None)})
+    lookup = _CompetitionLookup(fetch)
+    lookup.refresh("conn", [1])
+    for _ in range(5):
+        lookup.refresh("conn", [7])
+    assert len(fetch.conns) == 1
+    assert lookup[7] == _NO_COMPETITION
+
+
+def test_missing_and_none_ids_do_not_query():
+    fetch = _FakeFetch({1: ("a", None, None)})
+    lookup = _CompetitionLookup(fetch)
+    assert lookup[None] == _NO_COMPETITION
+    assert lookup[3] == _NO_COMPETITION
+    lookup.refresh("conn")
+    lookup.refresh("conn", [None])
+    assert lookup[None] == _NO_COMPETITION
+    assert len(fetch.conns) == 1
@@ -0,0 +1,88 @@
+import datetime
+import io
+import struct
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from api import _COPY_SIGNATURE, _binary_decoder, _iter_copy_binary
+
+
+def _field(payload):
+    if payload is None:
+        return struct.pack("!i", -1)
+    return struct.pack("!i", len(payload)) + payload
+
+
+def _stream(*rows):
+    """Build a binary COPY stream from rows of already-encoded field payloads."""
+    body = b"".join(
+        struct.pack("!h", len(row)) + b"".join(_field(f) for f in row) for row in rows
+    )
+    return io.BytesIO(_COPY_SIGNATURE + struct.pack("!ii", 0, 0) + body + struct.pack("!h", -1))
+
+
+def _numeric(ndigits, weight, sign, dscale, *digits):
+    return struct.pack(f"!hhHh{ndigits}H", ndigits, weight, sign, dscale, *digits)
+
+
+def _micros(value):
+    return struct.pack("!q", value)
+
+
+def _decoders(*oids, tz=datetime.timezone.utc):
+    return [_binary_decoder(f"c{i}", oid, tz) for i, oid in enumerate(oids)]
+
+
+def test_scalars_and_nulls():
+    fp = _stream(
+        [struct.pack("!q", 5), b"hello", b"\x01", struct.pack("!d", 1.5)],
+        [None, None, None, None],
+    )
+    rows = list(_iter_copy_binary(fp, _decoders(20, 25, 16, 701)))
+    assert rows == [(5, "hello", True, 1.5), (None, None, None, None)]
+
+
+def test_json_and_jsonb():
+    fp = _stream([b'{"a": 1}', b'\x01{"b": [1, 2]}'])
+    assert list(_iter_copy_binary(fp, _decoders(114, 3802))) == [({"a": 1}, {"b": [1, 2]})]
+
+
+def test_timestamps():
+    day = 86400 * 10 ** 6
+    fp = _stream([_micros(day), _micros(day), struct.pack("!i", -1)])
+    tz = ZoneInfo("America/New_York")
+    (row,) = _iter_copy_binary(fp, _decoders(1114, 1184, 1082, tz=tz))
+    assert row[0] == datetime.datetime(2000, 1, 2)
+    assert row[1] == datetime.datetime(2000, 1, 2, tzinfo=datetime.timezone.utc)
+    assert row[1].utcoffset() == datetime.timedelta(hours=-5)
+    assert row[2] == datetime.date(1999, 12, 31)
+
+
+def test_infinite_timestamps():
+    fp = _stream([_micros(2 ** 63 - 1), _micros(-(2 ** 63)), struct.pack("!i", 2 ** 31 - 1)])
+    (row,) = _iter_copy_binary(fp, _decoders(1114, 1184, 1082))
+    assert row[0] == datetime.datetime.max
+    assert row[1].replace(tzinfo=None) == datetime.datetime.min
+    assert row[2] == datetime.date.max
+
+
+def test_numeric():
+    fp = _stream(
+        [_numeric(2, 0, 0, 2, 12, 3400)],       # 12.34
+        [_numeric(1, 1, 0x4000, 0, 5)],         # -50000
+        [_numeric(0, 0, 0, 3)],                 # 0.000
+        [_numeric(0, 0, 0xC000, 0)],            # NaN
+    )
+    values = [row[0] for row in _iter_copy_binary(fp, _decoders(1700))]
+    assert values[:3] == [Decimal("12.34"), Decimal("-50000"), Decimal("0.000")]
+    assert str(values[1]) == "-50000" and str(values[2]) == "0.000"
+    assert values[3].is_nan()
+
+
+def test_rejects_unknown_type_and_bad_signature():
+    with pytest.raises(ValueError):
+        _binary_decoder("c", 600)
+    with pytest.raises(ValueError):
+        list(_iter_copy_binary(io.BytesIO(b"not a copy stream!!!"), []))
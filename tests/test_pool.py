@@ -0,0 +1,48 @@
+import threading
+
+import psycopg2
+
+import api
+
+
+class _FakeInfo:
+    transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.info = _FakeInfo()
+
+    def close(self):
+        self.closed = True
+
+    def rollback(self):
+        pass
+
+
+def test_returned_connections_are_reused(monkeypatch):
+    opened = []
+
+    def connect(*args, **kwargs):
+        conn = _FakeConnection()
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(api.psycopg2, "connect", connect)
+    pool = api._BlockingConnectionPool(1, 4, "postgresql://unused")
+
+    def worker():
+        for _ in range(20):
+            conn = pool.getconn(timeout=5)
+            pool.putconn(conn)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(opened) <= 4
+    assert not any(conn.closed for conn in opened)
+    pool.closeall()